@@ -0,0 +1,4 @@
+import os
+
+# Every auth module keeps its token files here; create it once when the package is imported
+os.makedirs('tokens', exist_ok=True)
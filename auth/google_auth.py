@@ -7,22 +7,22 @@ Handles OAuth flow and token management for Google Drive API
 import os
 import json
 import pickle
-from google.auth.transport.requests import Request
+from google.auth.transport.requests import AuthorizedSession, Request
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
 
 class GoogleDriveAuth:
     def __init__(self):
         # Scopes define what permissions we're asking for
         self.SCOPES = ['https://www.googleapis.com/auth/drive.readonly']
         self.credentials_file = 'google_credentials.json'
-        self.token_file = 'tokens/google_token.pickle'
+        self.token_file = 'tokens/google_token.json'
+        self.legacy_token_file = 'tokens/google_token.pickle'
+        # httplib2 response cache, so unchanged Drive API responses are revalidated
+        # or served locally instead of being downloaded again
+        self.http_cache_dir = 'tokens/.gdrive_cache'
         self.credentials = None
         self.service = None
-        
-        # Create tokens directory if it doesn't exist
-        os.makedirs('tokens', exist_ok=True)
+        self.authorized_session = None
     
     def authenticate(self):
         """
@@ -32,10 +32,7 @@ class GoogleDriveAuth:
         print("🔑 Authenticating with Google Drive...")
         
         # Check if we have valid credentials already
-        if os.path.exists(self.token_file):
-            print("📁 Found existing token, loading...")
-            with open(self.token_file, 'rb') as token:
-                self.credentials = pickle.load(token)
+        self._load_credentials()
         
         # If credentials are invalid or don't exist, get new ones
         if not self.credentials or not self.credentials.valid:
@@ -50,18 +47,42 @@ class GoogleDriveAuth:
                 return self._do_oauth_flow()
             
             # Save the credentials for next time
-            with open(self.token_file, 'wb') as token:
-                pickle.dump(self.credentials, token)
+            self._save_credentials()
         
-        # Build the service
+        # Build the service (googleapiclient is slow to import, so only load it here)
         try:
-            self.service = build('drive', 'v3', credentials=self.credentials)
+            from googleapiclient.discovery import build
+            # The pinned googleapiclient already defaults to the discovery document
+            # it bundles; spelled out so an upgrade can't silently switch to fetching it
+            self.service = build('drive', 'v3', http=self.new_http(), static_discovery=True)
             print("✅ Google Drive authentication successful!")
             return True
         except Exception as e:
             print(f"❌ Failed to build Google Drive service: {e}")
             return False
     
+    def _load_credentials(self):
+        """
+        Load saved credentials, migrating a legacy pickle token to JSON if present
+        """
+        if os.path.exists(self.token_file):
+            print("📁 Found existing token, loading...")
+            with open(self.token_file, 'r') as token:
+                self.credentials = Credentials.from_authorized_user_info(json.load(token), self.SCOPES)
+        elif os.path.exists(self.legacy_token_file):
+            print("📁 Found legacy pickle token, migrating to JSON...")
+            with open(self.legacy_token_file, 'rb') as token:
+                self.credentials = pickle.load(token)
+            self._save_credentials()
+            os.remove(self.legacy_token_file)
+    
+    def _save_credentials(self):
+        """
+        Save credentials as JSON
+        """
+        with open(self.token_file, 'w') as token:
+            token.write(self.credentials.to_json())
+    
     def _do_oauth_flow(self):
         """
         Perform the OAuth flow to get new credentials
@@ -75,13 +96,13 @@ class GoogleDriveAuth:
             return False
         
         try:
+            from google_auth_oauthlib.flow import InstalledAppFlow
             flow = InstalledAppFlow.from_client_secrets_file(
                 self.credentials_file, self.SCOPES)
             self.credentials = flow.run_local_server(port=0)
             
             # Save credentials
-            with open(self.token_file, 'wb') as token:
-                pickle.dump(self.credentials, token)
+            self._save_credentials()
             
             return True
         except Exception as e:
@@ -97,6 +118,30 @@ class GoogleDriveAuth:
                 return None
         return self.service
     
+    def get_authorized_session(self):
+        """
+        Get a requests session that attaches (and refreshes) the Google OAuth token.
+        Unlike the httplib2-based service, it is safe to share between threads,
+        which makes it the client for bulk file downloads.
+        """
+        if not self.authorized_session:
+            if not self.credentials and not self.authenticate():
+                return None
+            self.authorized_session = AuthorizedSession(self.credentials)
+        return self.authorized_session
+    
+    def new_http(self):
+        """
+        Get a new authorized httplib2 transport for the Drive service.
+        httplib2 connections are not thread-safe, so a thread that runs service
+        requests concurrently with others passes its own via request.execute(http=...).
+        """
+        import httplib2
+        from google_auth_httplib2 import AuthorizedHttp
+        if not self.credentials and not self.authenticate():
+            return None
+        return AuthorizedHttp(self.credentials, http=httplib2.Http(cache=self.http_cache_dir))
+    
     def test_connection(self):
         """
         Test the connection by getting user info
@@ -120,6 +165,8 @@ def main():
     Test function - run this file directly to test authentication
     """
     print("🧪 Testing Google Drive authentication...")
+    # auth/__init__.py (which creates tokens/) doesn't run when this file is executed directly
+    os.makedirs('tokens', exist_ok=True)
     auth = GoogleDriveAuth()
     
     if auth.authenticate():
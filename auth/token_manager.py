@@ -6,15 +6,46 @@ Centralized token storage and management for all services
 
 import os
 import json
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
+from functools import lru_cache
+
+def _file_signature(path):
+    """
+    Return (mtime_ns, size, inode) for path, or None if it doesn't exist.
+    Size and inode catch rewrites that land within the filesystem's mtime
+    resolution (atomic replaces always get a new inode).
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+@lru_cache(maxsize=8)
+def _read_json(path, signature):
+    """
+    Read and parse a JSON file; cached per (path, file signature) so unchanged files skip the disk
+    """
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def _load_json_cached(path):
+    """
+    Return the parsed JSON at path, or None if the file doesn't exist
+    """
+    signature = _file_signature(path)
+    if signature is None:
+        return None
+    return _read_json(path, signature)
 
 class TokenManager:
     def __init__(self):
         self.tokens_dir = 'tokens'
         self.config_file = 'config.json'
         
-        # Create tokens directory if it doesn't exist
-        os.makedirs(self.tokens_dir, exist_ok=True)
+        # service -> (token file signature or None if missing, expiry epoch or None)
+        self._status_cache = {}
     
     def save_config(self, service, config_data):
         """
@@ -23,8 +54,13 @@ class TokenManager:
         config = self.load_config()
         config[service] = config_data
         
-        with open(self.config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        serialized = json.dumps(config, indent=2)
+        tmp_file = f"{self.config_file}.tmp"
+        with open(tmp_file, 'w') as f:
+            f.write(serialized)
+        os.replace(tmp_file, self.config_file)
+        _read_json.cache_clear()
+        self._status_cache.clear()
         
         print(f"💾 Saved configuration for {service}")
     
@@ -32,12 +68,10 @@ class TokenManager:
         """
         Load configuration data
         """
-        if not os.path.exists(self.config_file):
-            return {}
-        
         try:
-            with open(self.config_file, 'r') as f:
-                return json.load(f)
+            config = _load_json_cached(self.config_file)
+            # Copy so callers can modify it without touching the cached dict
+            return dict(config) if config else {}
         except Exception as e:
             print(f"⚠️  Warning: Could not load config: {e}")
             return {}
@@ -49,34 +83,68 @@ class TokenManager:
         config = self.load_config()
         return config.get(service, {})
     
+    def get_parsed_tokens(self, service):
+        """
+        Get the parsed token file for a service, or None if there isn't one.
+        Shares the in-memory cache with is_authenticated, so the file is parsed once
+        per change. The returned dict is shared - don't modify it.
+        """
+        token_files = {
+            'google': f'{self.tokens_dir}/google_token.json',
+            'adobe': f'{self.tokens_dir}/adobe_token.json'
+        }
+        if service not in token_files:
+            return None
+        
+        try:
+            return _load_json_cached(token_files[service])
+        except Exception as e:
+            print(f"⚠️  Warning: Could not load {service} tokens: {e}")
+            return None
+    
     def is_authenticated(self, service):
         """
         Check if we have valid authentication for a service
         """
         if service == 'google':
-            return os.path.exists(f'{self.tokens_dir}/google_token.pickle')
+            # Legacy pickle tokens are migrated to JSON on the next Google login
+            return (os.path.exists(f'{self.tokens_dir}/google_token.json') or
+                    os.path.exists(f'{self.tokens_dir}/google_token.pickle'))
         elif service == 'adobe':
             token_file = f'{self.tokens_dir}/adobe_token.json'
-            if not os.path.exists(token_file):
-                return False
+            signature = _file_signature(token_file)
             
-            # Check if Adobe token is still valid
-            try:
-                with open(token_file, 'r') as f:
-                    token_data = json.load(f)
-                
-                expires_at_str = token_data.get('expires_at')
-                if expires_at_str:
-                    from datetime import datetime, timedelta
-                    expires_at = datetime.fromisoformat(expires_at_str)
-                    # Consider valid if expires more than 5 minutes from now
-                    return datetime.now() < (expires_at - timedelta(minutes=5))
-                
-                return False
-            except:
+            # Only re-parse the expiry when the token file has changed
+            cached = self._status_cache.get(service)
+            if cached and cached[0] == signature:
+                expires_at = cached[1]
+            else:
+                expires_at = self._read_adobe_expiry(token_file) if signature is not None else None
+                self._status_cache[service] = (signature, expires_at)
+            
+            if not expires_at:
                 return False
+            
+            # Consider valid if expires more than 5 minutes from now
+            return time.time() < expires_at - 300
         return False
     
+    def _read_adobe_expiry(self, token_file):
+        """
+        Read the expiry (unix seconds) from the Adobe token file, or None if unavailable
+        """
+        try:
+            token_data = _load_json_cached(token_file)
+            if not token_data:
+                return None
+            if token_data.get('expires_at_epoch') is not None:
+                return int(token_data['expires_at_epoch'])
+            # Token files written before the epoch field only have an ISO timestamp
+            expires_at_str = token_data.get('expires_at')
+            return int(datetime.fromisoformat(expires_at_str).timestamp()) if expires_at_str else None
+        except:
+            return None
+    
     def clear_tokens(self, service=None):
         """
         Clear tokens for a service (or all if service is None)
@@ -84,12 +152,14 @@ class TokenManager:
         if service:
             files_to_remove = []
             if service == 'google':
+                files_to_remove.append(f'{self.tokens_dir}/google_token.json')
                 files_to_remove.append(f'{self.tokens_dir}/google_token.pickle')
             elif service == 'adobe':  
                 files_to_remove.append(f'{self.tokens_dir}/adobe_token.json')
         else:
             # Clear all tokens
             files_to_remove = [
+                f'{self.tokens_dir}/google_token.json',
                 f'{self.tokens_dir}/google_token.pickle',
                 f'{self.tokens_dir}/adobe_token.json'
             ]
@@ -98,6 +168,9 @@ class TokenManager:
             if os.path.exists(file_path):
                 os.remove(file_path)
                 print(f"🗑️  Removed {file_path}")
+        
+        _read_json.cache_clear()
+        self._status_cache.clear()
     
     def get_auth_status(self):
         """
@@ -4,12 +4,12 @@ Lightroom Sync Tool
 Complete flow: Authentication -> Folder Selection -> Album Selection -> Summary
 """
 
-from auth.google_auth import GoogleDriveAuth
-from auth.adobe_auth import AdobeLightroomAuth
+import os
 from auth.token_manager import TokenManager
-from ui.menus import GoogleDriveFolderSelector, LightroomAlbumSelector
 from rich.console import Console
-from sync.logic import SyncLogic
+
+# The Google/Adobe clients, menus and sync logic pull in heavy dependencies
+# (googleapiclient, requests, ...), so they are imported lazily in main()
 
 console = Console()
 
@@ -25,6 +25,7 @@ def main():
     token_manager.print_status()
     
     # Authenticate with Google Drive
+    from auth.google_auth import GoogleDriveAuth
     google_auth = GoogleDriveAuth()
     
     if not google_auth.authenticate():
@@ -34,7 +35,8 @@ def main():
     google_auth.test_connection()
     
     # Authenticate with Adobe Lightroom
-    adobe_auth = AdobeLightroomAuth()
+    from auth.adobe_auth import AdobeLightroomAuth
+    adobe_auth = AdobeLightroomAuth(token_manager=token_manager)
     
     if not adobe_auth.authenticate():
         console.print("❌ Adobe Lightroom authentication failed", style="red")
@@ -46,6 +48,7 @@ def main():
     
     # Step 2: Google Drive Folder Selection
     console.print("\n📋 [bold]Step 2: Select Google Drive Folder[/bold]")
+    from ui.menus import GoogleDriveFolderSelector, LightroomAlbumSelector
     
     folder_selector = GoogleDriveFolderSelector(google_auth)
     folder_id, folder_path = folder_selector.select_folder()
@@ -78,14 +81,20 @@ def main():
     console.print("\n✅ [bold green]Setup complete! Ready for file sync.[/bold green]")
     console.print("💡 [italic]Next: We'll add the file transfer functionality.[/italic]")
 
+    # Refresh the Adobe token now if it would lapse during the sync
+    adobe_auth.ensure_fresh_token()
+
      # --- Step 5: File Synchronization ---
     console.print("\n📋 [bold]Step 5: Initiating File Synchronization[/bold]")
-    sync_tool = SyncLogic(google_auth, adobe_auth)
+    from sync.logic import SyncLogic
+    # Set SYNC_VERBOSE=1 for per-file messages instead of a progress bar
+    verbose = os.getenv('SYNC_VERBOSE', '').lower() in ('1', 'true', 'yes')
+    sync_tool = SyncLogic(google_auth, adobe_auth, verbose=verbose)
     
-    # List files from Google Drive
+    # List files from Google Drive (lazily, page by page)
     drive_files = sync_tool.list_drive_files(folder_id)
     
-    # Perform the actual synchronization
+    # Perform the actual synchronization; transfers start as soon as the first page is listed
     sync_tool.sync_folder_to_album(drive_files, album_id, album_name, catalogue_id) 
     # --- End Step ---
 
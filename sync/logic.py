@@ -1,74 +1,417 @@
-import io
+import os
 import json
+import mimetypes
 import uuid
+import queue
+import threading
+from collections import deque
+from itertools import islice
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from rich.console import Console
-from googleapiclient.http import MediaIoBaseDownload 
+from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, MofNCompleteColumn, TimeElapsedColumn
+from auth.adobe_auth import OK_STATUSES, TRANSIENT_RETRIES
+from sync.tracing import get_tracer, span
 
 console = Console()
 
+# How many files are downloaded/uploaded at the same time. Must stay below the
+# Adobe session's pool_maxsize so workers don't wait on connections.
+MAX_CONCURRENT_TRANSFERS = 8
+
+DRIVE_FILES_URL = 'https://www.googleapis.com/drive/v3/files'
+
+# Read size for streaming Drive downloads straight into Lightroom uploads
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# album_id -> {drive file id -> {'md5': Drive md5Checksum, 'asset_id': Lightroom asset id}}
+SYNC_STATE_FILE = 'tokens/sync_state.json'
+
+# Files larger than this are downloaded as several byte ranges in parallel; a
+# single Drive connection caps throughput well below what the link can do
+RANGE_DOWNLOAD_THRESHOLD = 16 << 20
+RANGE_PART_SIZE = 8 << 20
+# Ranges fetched ahead of the upload per file; bounds memory to window * part size
+RANGE_DOWNLOAD_WINDOW = 4
+
+# Uploaded assets are added to the album with one PUT per this many assets
+ALBUM_ADD_BATCH_SIZE = 50
+
+# MIME types for camera formats the mimetypes module doesn't know; Drive often
+# reports these as application/octet-stream
+MIME_TYPE_OVERRIDES = {
+    '.heic': 'image/heic',
+    '.heif': 'image/heif',
+    '.dng': 'image/x-adobe-dng',
+    '.cr2': 'image/x-canon-cr2',
+    '.cr3': 'image/x-canon-cr3',
+    '.nef': 'image/x-nikon-nef',
+    '.arw': 'image/x-sony-arw',
+    '.raf': 'image/x-fuji-raf',
+    '.orf': 'image/x-olympus-orf',
+    '.rw2': 'image/x-panasonic-rw2',
+}
+
+# Lightroom asset subtype by the top-level MIME type; anything else is uploaded as an image
+SUBTYPE_BY_MIME_PREFIX = {
+    'image': 'image',
+    'video': 'video',
+}
+
+# Added to the auth's cached headers (which already carry the JSON Content-Type)
+CREATE_ASSET_HEADERS = {
+    'If-None-Match': '*'  # Ensures we don't overwrite existing assets
+}
+
+# Fields of the asset creation payload's importSource that are the same for every file
+IMPORT_SOURCE_TEMPLATE = {
+    "importedOnDevice": "Partner API Upload",
+}
+
+class DriveFileStream:
+    """
+    The bytes of a Drive file, streamed chunk by chunk without buffering the whole file.
+    Exposes __len__ (from Drive's reported size) so requests sends a Content-Length
+    instead of chunked encoding, and opens a fresh download whenever it is iterated
+    again, so a retried upload can replay the body.
+    """
+    def __init__(self, open_response, size, first_response=None):
+        self._open_response = open_response
+        self._size = size
+        self._pending_response = first_response
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        response = self._pending_response or self._open_response()
+        self._pending_response = None
+        try:
+            yield from response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE)
+        finally:
+            response.close()
+
+    def close(self):
+        """
+        Release the download opened up front if the upload never consumed it
+        """
+        if self._pending_response is not None:
+            self._pending_response.close()
+            self._pending_response = None
+
+class RangedDriveFileStream:
+    """
+    The bytes of a large Drive file, fetched as byte ranges in parallel and yielded
+    in order. Only RANGE_DOWNLOAD_WINDOW parts are in flight or buffered at a time,
+    so the upload still streams instead of holding the whole file. Like
+    DriveFileStream it has __len__ and can be iterated again for a retried upload.
+    """
+    def __init__(self, fetch_range, size, executor, part_size=RANGE_PART_SIZE, window=RANGE_DOWNLOAD_WINDOW, release=None):
+        self._fetch_range = fetch_range
+        # Called with each part once the upload has sent it, e.g. to recycle its buffer
+        self._release = release
+        self._size = size
+        self._executor = executor
+        self._part_size = part_size
+        self._window = window
+        # Start the first ranges right away so they overlap with the asset creation
+        self._parts = self._iter_parts()
+        self._pending = deque(self._submit(part) for part in islice(self._parts, window))
+
+    def _iter_parts(self):
+        for start in range(0, self._size, self._part_size):
+            yield start, min(start + self._part_size, self._size) - 1
+
+    def _submit(self, part):
+        return self._executor.submit(self._fetch_range, *part)
+
+    def __len__(self):
+        return self._size
+
+    def wait_first_part(self):
+        """
+        Block until the first range arrives, raising its error if the download failed
+        """
+        if self._pending:
+            self._pending[0].result()
+
+    def __iter__(self):
+        if self._pending is None:
+            # Replay for a retried upload: start over from the first range
+            self._parts = self._iter_parts()
+            self._pending = deque(self._submit(part) for part in islice(self._parts, self._window))
+        pending, parts = self._pending, self._parts
+        self._pending = None
+        try:
+            while pending:
+                data = pending.popleft().result()
+                next_part = next(parts, None)
+                if next_part is not None:
+                    pending.append(self._submit(next_part))
+                yield data
+                # The upload only asks for the next part after sending this one
+                if self._release:
+                    self._release(data)
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def close(self):
+        """
+        Cancel ranges that were started but never consumed by the upload
+        """
+        if self._pending is not None:
+            for future in self._pending:
+                future.cancel()
+            self._pending = None
+
 class SyncLogic:
-    def __init__(self, google_drive_auth, adobe_lightroom_auth):
+    def __init__(self, google_drive_auth, adobe_lightroom_auth, max_workers=MAX_CONCURRENT_TRANSFERS, verbose=False):
         self.google_drive_auth = google_drive_auth
         self.adobe_lightroom_auth = adobe_lightroom_auth
+        self.max_workers = max_workers
+        # Per-file progress messages; without them a single progress bar is shown
+        self.verbose = verbose
+        # Recorded as importedBy on every asset; test_connection has fetched it by now
+        self._account_id = getattr(adobe_lightroom_auth, 'account_info', {}).get('id', 'Unknown')
+        # Stage timings; None (no-op spans) unless SYNC_OTLP_ENDPOINT is set
+        self._tracer = get_tracer()
+        # Thread-safe, pooled Drive client shared by all transfer workers. Size its
+        # keep-alive pool to the worker count so no worker has to open a new
+        # connection (and discard it afterwards) once the pool is warm.
+        self.drive_session = google_drive_auth.get_authorized_session()
+        # Room for one streamed download per worker plus the range fetchers below
+        self.drive_session.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=2 * max_workers, max_retries=TRANSIENT_RETRIES))
+        # Shared by all large downloads so parallel ranges don't multiply with the
+        # number of files in flight
+        self.range_executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='drive-range')
+        # Recycled RANGE_PART_SIZE buffers the ranges are read into, so large files
+        # don't allocate (and free) a fresh buffer for every part. Capped at one
+        # window of parts per worker; buffers returned beyond that are dropped.
+        self._buffer_pool = queue.Queue(maxsize=max_workers * RANGE_DOWNLOAD_WINDOW)
+        
+        self.sync_state = self._load_sync_state()
+        self._sync_state_lock = threading.Lock()
+        
+        # Uploads reuse the Adobe session's pool; warn if it is too small for our workers
+        adobe_pool_size = self.adobe_lightroom_auth.pool_maxsize
+        if adobe_pool_size < max_workers:
+            console.print(f"⚠️ [yellow]Adobe connection pool ({adobe_pool_size}) is smaller than the {max_workers} sync workers[/yellow]")
+
+    def _log(self, message, style="dim"):
+        """
+        Print a per-file progress message in verbose mode.
+        Messages are plain text (no markup parsing), so file names with [brackets] print as-is.
+        """
+        if self.verbose:
+            console.print(message, style=style, markup=False, highlight=False)
 
     def list_drive_files(self, folder_id):
         """
         Lists all files within a specified Google Drive folder using the Google Drive API.
+        This is a generator that follows nextPageToken and yields files as each page
+        arrives, so transfers can start before the whole folder has been listed.
         """
         console.print(f"\n📂 [bold blue]Listing files in Google Drive folder ID:[/bold blue] {folder_id}")
         
+        found = 0
+        page_token = None
         try:
-            results = self.google_drive_auth.service.files().list(
-                q=f"'{folder_id}' in parents and trashed=false",
-                fields="files(id, name, mimeType, size)"
-            ).execute()
-            files = results.get('files', [])
-            
-            if not files:
-                console.print("    No files found in this Google Drive folder.")
-            else:
-                console.print(f"    Found [bold]{len(files)}[/bold] files:")
-                for file in files:
-                    console.print(f"    - Name: [cyan]{file.get('name')}[/cyan], ID: [grey50]{file.get('id')}[/grey50], Type: {file.get('mimeType')}")
-            
-            return files
+            while True:
+                results = self.google_drive_auth.service.files().list(
+                    q=f"'{folder_id}' in parents and trashed=false",
+                    fields="nextPageToken, files(id, name, mimeType, size, md5Checksum)",
+                    pageSize=1000,
+                    pageToken=page_token
+                ).execute()
+                
+                for file in results.get('files', []):
+                    found += 1
+                    self._log(f"    - Name: {file.get('name')}, ID: {file.get('id')}, Type: {file.get('mimeType')}", style=None)
+                    yield file
+                
+                page_token = results.get('nextPageToken')
+                if not page_token:
+                    break
 
         except Exception as e:
             console.print(f"❌ Error listing Google Drive files: [red]{e}[/red]", style="red")
-            return []
+        
+        if not found:
+            console.print("    No files found in this Google Drive folder.")
+        else:
+            console.print(f"    Found [bold]{found}[/bold] files.")
+
+    def _load_sync_state(self):
+        """
+        Load what previous runs uploaded, per album
+        """
+        try:
+            with open(SYNC_STATE_FILE, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            console.print(f"⚠️ [yellow]Could not read sync state, all files will be uploaded: {e}[/yellow]")
+            return {}
 
-    def _download_file_from_drive(self, file_id, file_name):
+    def _save_sync_state(self):
+        """
+        Persist the sync state atomically so an interrupted write can't corrupt it
+        """
+        try:
+            tmp_file = f"{SYNC_STATE_FILE}.tmp"
+            with open(tmp_file, 'w') as f:
+                json.dump(self.sync_state, f, separators=(',', ':'))
+            os.replace(tmp_file, SYNC_STATE_FILE)
+        except Exception as e:
+            console.print(f"⚠️ [yellow]Could not save sync state: {e}[/yellow]")
+
+    def _list_album_asset_ids(self, catalogue_id, album_id):
+        """
+        Returns the ids of all assets currently in the Lightroom album
+        """
+        asset_ids = set()
+        endpoint = f"/v2/catalogs/{catalogue_id}/albums/{album_id}/assets"
+        params = {'limit': 500}
+        while endpoint:
+            response = self.adobe_lightroom_auth.make_authenticated_request(
+                method="GET", endpoint=endpoint, params=params
+            )
+            data = json.loads(response.content) if response.content else {}
+            for resource in data.get('resources', []):
+                asset_id = resource.get('asset', {}).get('id') or resource.get('id')
+                if asset_id:
+                    asset_ids.add(asset_id)
+            
+            # Next page links are relative to the catalog and carry their own query
+            next_href = data.get('links', {}).get('next', {}).get('href')
+            endpoint = f"/v2/catalogs/{catalogue_id}/{next_href}" if next_href else None
+            params = None
+        return asset_ids
+
+    def _open_drive_media(self, file_id):
+        """
+        Start a streamed download of a Drive file's content
+        """
+        # Plain authorized GET of the file's media instead of MediaIoBaseDownload's
+        # chunked loop over a (non thread-safe) httplib2 connection
+        response = self.drive_session.get(
+            f"{DRIVE_FILES_URL}/{file_id}", params={'alt': 'media'}, stream=True, timeout=60
+        )
+        response.raise_for_status()
+        return response
+
+    def _take_buffer(self):
+        """
+        Get a part buffer from the pool, allocating one only if none is free
+        """
+        try:
+            return self._buffer_pool.get_nowait()
+        except queue.Empty:
+            return bytearray(RANGE_PART_SIZE)
+
+    def _return_buffer(self, buffer):
+        """
+        Put a part buffer back in the pool, or let it go if the pool is full
+        """
+        try:
+            self._buffer_pool.put_nowait(buffer)
+        except queue.Full:
+            pass
+
+    def _release_part(self, part):
+        """
+        Return the buffer behind a part fetched by _fetch_drive_range to the pool
+        """
+        self._return_buffer(part.obj)
+
+    def _fetch_drive_range(self, file_id, start, end):
+        """
+        Download bytes start..end (inclusive) of a Drive file into a pooled buffer.
+        Returns a memoryview of the buffer; hand it back with _release_part.
+        """
+        length = end - start + 1
+        # Ask for the raw bytes: the range must match the stored file, and readinto
+        # below bypasses requests' content decoding
+        response = self.drive_session.get(
+            f"{DRIVE_FILES_URL}/{file_id}", params={'alt': 'media'},
+            headers={'Range': f'bytes={start}-{end}', 'Accept-Encoding': 'identity'},
+            stream=True, timeout=60
+        )
+        try:
+            response.raise_for_status()
+            # A 200 would be the whole file, not the requested slice
+            if response.status_code != 206:
+                raise ValueError(f"Drive ignored the range request (status {response.status_code})")
+            
+            buffer = self._take_buffer()
+            view = memoryview(buffer)[:length]
+            filled = 0
+            while filled < length:
+                read = response.raw.readinto(view[filled:])
+                if not read:
+                    break
+                filled += read
+            if filled != length:
+                self._return_buffer(buffer)
+                raise ValueError(f"Drive range ended after {filled} of {length} bytes")
+            return view
+        finally:
+            response.close()
+
+    def _download_file_from_drive(self, file_id, file_name, file_size=None):
         """
         Downloads a file from Google Drive.
-        Returns the file content as bytes.
+        Returns a DriveFileStream when Drive reported the file size, so the content
+        can flow straight into the upload (a RangedDriveFileStream for large files);
+        otherwise the whole content as bytes.
         """
-        console.print(f"    ⬇️ [dim]Downloading '{file_name}' from Google Drive...[/dim]")
+        self._log(f"    ⬇️ Downloading '{file_name}' from Google Drive...")
         try:
-            request = self.google_drive_auth.service.files().get_media(fileId=file_id)
-            fh = io.BytesIO()
-            downloader = MediaIoBaseDownload(fh, request)
-            done = False
-            while done is False:
-                status, done = downloader.next_chunk()
-            fh.seek(0)
-            console.print(f"    ✅ [dim]Downloaded '{file_name}'.[/dim]")
-            return fh.read()
+            if file_size and file_size > RANGE_DOWNLOAD_THRESHOLD:
+                stream = RangedDriveFileStream(
+                    lambda start, end: self._fetch_drive_range(file_id, start, end), file_size, self.range_executor,
+                    release=self._release_part
+                )
+                # Surface download errors here, not mid-upload
+                try:
+                    stream.wait_first_part()
+                except Exception:
+                    stream.close()
+                    raise
+                self._log(f"    ✅ Streaming '{file_name}' ({file_size} bytes) into Lightroom in parallel ranges.")
+                return stream
+            
+            # Open the first download right away so errors show up here, not mid-upload
+            response = self._open_drive_media(file_id)
+            if not file_size:
+                content = response.content
+                self._log(f"    ✅ Downloaded '{file_name}'.")
+                return content
+            
+            self._log(f"    ✅ Streaming '{file_name}' ({file_size} bytes) into Lightroom.")
+            return DriveFileStream(lambda: self._open_drive_media(file_id), file_size, first_response=response)
         except Exception as e:
-            console.print(f"    ❌ [red]Error downloading '{file_name}': {e}[/red]")
+            console.print(f"    ❌ Error downloading '{file_name}': {e}", style="red", markup=False, highlight=False)
             return None
 
-    def _get_asset_subtype(self, mime_type):
+    @staticmethod
+    def _guess_mime(file_name):
+        """
+        Guess a file's MIME type from its extension, or None if it's unknown
+        """
+        extension = os.path.splitext(file_name)[1].lower()
+        return MIME_TYPE_OVERRIDES.get(extension) or mimetypes.guess_type(file_name)[0]
+
+    @staticmethod
+    def _get_asset_subtype(mime_type):
         """
         Determine the asset subtype based on MIME type
         """
-        if mime_type.startswith('image/'):
-            return 'image'
-        elif mime_type.startswith('video/'):
-            return 'video'
-        else:
-            return 'image'  # Default to image
+        return SUBTYPE_BY_MIME_PREFIX.get(mime_type.split('/', 1)[0], 'image')
 
     def _upload_file_to_lightroom(self, catalogue_id, file_content, file_name, album_id, mime_type="image/jpeg"):
         """
@@ -77,17 +420,20 @@ class SyncLogic:
         FIXED: Uses the proper 2-step Adobe Lightroom upload process:
         1. Create asset with PUT /v2/catalogs/{catalog_id}/assets/{asset_id}
         2. Upload binary data with PUT /v2/catalogs/{catalog_id}/assets/{asset_id}/master
+        Adding the asset to the album is left to _add_assets_to_album, which does it
+        for many assets at once.
+        Returns the new asset's ID, or None if the upload failed.
         """
         if not file_content:
-            console.print(f"        ⚠️ [yellow]Skipping upload for '{file_name}' due to missing content.[/yellow]")
-            return False
+            console.print(f"        ⚠️ Skipping upload for '{file_name}' due to missing content.", style="yellow", markup=False, highlight=False)
+            return None
 
-        console.print(f"        ⬆️ [dim]Uploading '{file_name}' to Lightroom album ID '{album_id}'...[/dim]")
+        self._log(f"        ⬆️ Uploading '{file_name}' to Lightroom album ID '{album_id}'...")
         
         try:
             # Generate a unique asset ID (GUID without hyphens as per Adobe docs)
-            asset_id = str(uuid.uuid4()).replace('-', '')
-            console.print(f"        [dim]Generated asset ID: {asset_id}[/dim]")
+            asset_id = uuid.uuid4().hex
+            self._log(f"        Generated asset ID: {asset_id}")
             
             # Step 1: Create an Asset
             create_asset_endpoint = f"/v2/catalogs/{catalogue_id}/assets/{asset_id}"
@@ -95,125 +441,224 @@ class SyncLogic:
             # Determine asset subtype
             asset_subtype = self._get_asset_subtype(mime_type)
             
+            now = datetime.now().isoformat()
             create_payload = {
                 "subtype": asset_subtype,
                 "payload": {
-                    "captureDate": datetime.now().isoformat(),
+                    "captureDate": now,
                     "importSource": {
+                        **IMPORT_SOURCE_TEMPLATE,
                         "fileName": file_name,
-                        "importedOnDevice": "Partner API Upload",
-                        "importedBy": self.adobe_lightroom_auth.account_info.get('id', 'Unknown'),
-                        "importTimestamp": datetime.now().isoformat()
+                        "importedBy": self._account_id,
+                        "importTimestamp": now
                     }
                 }
             }
             
-            console.print(f"        [dim]1/3: Creating asset '{file_name}' with ID {asset_id}...")
-            response = self.adobe_lightroom_auth.make_authenticated_request(
-                method="PUT",
-                endpoint=create_asset_endpoint,
-                json_data=create_payload,
-                headers={
-                    'Content-Type': 'application/json',
-                    'If-None-Match': '*'  # Ensures we don't overwrite existing assets
-                }
-            )
+            self._log(f"        1/2: Creating asset '{file_name}' with ID {asset_id}...")
+            with span(self._tracer, "lr.asset.create", asset_id=asset_id):
+                response = self.adobe_lightroom_auth.make_authenticated_request(
+                    method="PUT",
+                    endpoint=create_asset_endpoint,
+                    json_data=create_payload,
+                    headers=CREATE_ASSET_HEADERS
+                )
             
-            if response.status_code not in [201, 200]:
+            if response.status_code not in OK_STATUSES:
                 raise ValueError(f"Asset creation failed with status {response.status_code}")
             
-            console.print(f"        [dim]Asset created successfully.[/dim]")
+            self._log("        Asset created successfully.")
 
             # Step 2: Upload the Binary Data
             upload_master_endpoint = f"/v2/catalogs/{catalogue_id}/assets/{asset_id}/master"
             
-            console.print(f"        [dim]2/3: Uploading binary data for '{file_name}'...")
+            self._log(f"        2/2: Uploading binary data for '{file_name}'...")
             
-            # Upload headers for binary data
+            # Upload headers for binary data. No Content-Length here: requests derives
+            # it from len() of the bytes or DriveFileStream and still streams the latter.
             upload_headers = {
                 'Content-Type': mime_type,
-                'Content-Length': str(len(file_content))
+                # Nothing worth compressing comes back from the master upload
+                'Accept-Encoding': 'identity'
             }
             
-            # Remove the default JSON content-type and use binary upload
-            response = self.adobe_lightroom_auth.make_authenticated_request(
-                method="PUT",
-                endpoint=upload_master_endpoint,
-                data=file_content,  # Use 'data' for binary, not 'json_data'
-                headers=upload_headers
-            )
+            # Remove the default JSON content-type and use binary upload. Streamed
+            # content is downloaded while it uploads, so this span covers both.
+            with span(self._tracer, "lr.asset.master", asset_id=asset_id, size=len(file_content)):
+                response = self.adobe_lightroom_auth.make_authenticated_request(
+                    method="PUT",
+                    endpoint=upload_master_endpoint,
+                    data=file_content,  # Use 'data' for binary, not 'json_data'
+                    headers=upload_headers
+                )
             
-            if response.status_code not in [201, 200]:
+            if response.status_code not in OK_STATUSES:
                 raise ValueError(f"Binary upload failed with status {response.status_code}")
             
-            console.print(f"        [dim]Binary data uploaded successfully.[/dim]")
-
-            # Step 3: Add the asset to the Album
-            add_to_album_endpoint = f"/v2/catalogs/{catalogue_id}/albums/{album_id}/assets"
-            
-            add_payload = {
-                "resources": [
-                    {
-                        "id": asset_id,
-                        "payload": {
-                            "cover": False
-                        }
-                    }
-                ]
-            }
-            
-            console.print(f"        [dim]3/3: Adding asset '{file_name}' to album '{album_id}'...")
-            response = self.adobe_lightroom_auth.make_authenticated_request(
-                method="PUT",
-                endpoint=add_to_album_endpoint,
-                json_data=add_payload,
-                headers={'Content-Type': 'application/json'}
-            )
-            
-            if response.status_code not in [201, 200]:
-                console.print(f"        ⚠️ [yellow]Warning: Could not add to album (status {response.status_code}), but upload succeeded.[/yellow]")
-            else:
-                console.print(f"        [dim]Asset added to album successfully.[/dim]")
+            self._log("        Binary data uploaded successfully.")
             
-            console.print(f"        ✅ [green]Successfully uploaded '{file_name}' to Lightroom.[/green]")
-            return True
+            self._log(f"        ✅ Successfully uploaded '{file_name}' to Lightroom.", style="green")
+            return asset_id
 
         except requests.exceptions.HTTPError as http_err:
-            console.print(f"        ❌ [red]HTTP Error uploading '{file_name}': {http_err}[/red]")
+            console.print(f"        ❌ HTTP Error uploading '{file_name}': {http_err}", style="red", markup=False, highlight=False)
             if http_err.response is not None:
-                console.print(f"           [red]Response: {http_err.response.text}[/red]")
-            return False
+                console.print(f"           Response: {http_err.response.text}", style="red", markup=False, highlight=False)
+            return None
         except Exception as e:
-            console.print(f"        ❌ [red]General Error uploading '{file_name}': {e}[/red]")
-            return False
+            console.print(f"        ❌ General Error uploading '{file_name}': {e}", style="red", markup=False, highlight=False)
+            return None
 
-    def sync_folder_to_album(self, drive_files, album_id, album_name, catalogue_id):
+    def _add_assets_to_album(self, catalogue_id, album_id, uploads, album_state):
         """
-        Downloads files from Google Drive and uploads them to a Lightroom album in batches.
+        Add uploaded assets to the album with a single PUT.
+        uploads is a list of (Drive file, asset ID) pairs; files that made it into the
+        album are recorded in album_state so later runs can skip them.
         """
-        if not drive_files:
-            console.print("\n⏩ [bold yellow]No files to synchronize.[/bold yellow]")
+        add_to_album_endpoint = f"/v2/catalogs/{catalogue_id}/albums/{album_id}/assets"
+        
+        add_payload = {
+            "resources": [
+                {
+                    "id": asset_id,
+                    "payload": {
+                        "cover": False
+                    }
+                }
+                for _, asset_id in uploads
+            ]
+        }
+        
+        self._log(f"        Adding {len(uploads)} assets to album '{album_id}'...")
+        try:
+            with span(self._tracer, "lr.album.add", assets=len(uploads)):
+                response = self.adobe_lightroom_auth.make_authenticated_request(
+                    method="PUT",
+                    endpoint=add_to_album_endpoint,
+                    json_data=add_payload
+                )
+            if response.status_code not in OK_STATUSES:
+                raise ValueError(f"status {response.status_code}")
+        except Exception as e:
+            console.print(f"        ⚠️ Warning: Could not add {len(uploads)} assets to album ({e}), but they were uploaded.", style="yellow", markup=False, highlight=False)
             return
+        
+        self._log("        Assets added to album successfully.")
+        with self._sync_state_lock:
+            for file, asset_id in uploads:
+                if file.get('md5Checksum'):
+                    album_state[file['id']] = {'md5': file['md5Checksum'], 'asset_id': asset_id}
 
+    def sync_folder_to_album(self, drive_files, album_id, album_name, catalogue_id):
+        """
+        Downloads files from Google Drive and uploads them to a Lightroom album,
+        several at a time. drive_files may be a list or the list_drive_files generator.
+        """
         console.print(f"\n🔄 [bold purple]Starting actual synchronization of files to album:[/bold purple] [bold]{album_name}[/bold]")
+        console.print(f"    [bold cyan]Transferring files, up to {self.max_workers} at a time[/bold cyan]")
+        
+        # Files uploaded by earlier runs are only skipped if their asset is still in the album
+        album_state = self.sync_state.setdefault(album_id, {})
+        album_asset_ids = set()
+        if album_state:
+            try:
+                album_asset_ids = self._list_album_asset_ids(catalogue_id, album_id)
+            except Exception as e:
+                console.print(f"    ⚠️ [yellow]Could not list album assets, all files will be uploaded: {e}[/yellow]")
         
-        batch_size = 5
-        for i in range(0, len(drive_files), batch_size):
-            batch = drive_files[i:i + batch_size]
-            console.print(f"\n    [bold cyan]Processing batch {int(i/batch_size) + 1} of {len(drive_files) // batch_size + (1 if len(drive_files) % batch_size > 0 else 0)}:[/bold cyan]")
-            for file in batch:
-                file_name = file.get('name', 'Unknown File')
-                file_id = file.get('id')
-                file_mime_type = file.get('mimeType', 'application/octet-stream')
-
-                if not file_id:
-                    console.print(f"        ⚠️ [yellow]Skipping '{file_name}' - no file ID found.[/yellow]")
-                    continue
-
-                file_content = self._download_file_from_drive(file_id, file_name)
-                if file_content:
-                    self._upload_file_to_lightroom(catalogue_id, file_content, file_name, album_id, file_mime_type)
-                else:
-                    console.print(f"        ❌ [red]Failed to get content for '{file_name}', skipping upload.[/red]")
+        progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TimeElapsedColumn(),
+            console=console,
+            disable=self.verbose,
+        )
+        task = progress.add_task("Syncing files", total=None)
+
+        def listed_files():
+            # The total grows as the listing pages arrive
+            for listed, file in enumerate(drive_files, 1):
+                progress.update(task, total=listed)
+                yield file
+
+        # Uploaded assets waiting to be added to the album in one request
+        pending_adds = []
+        pending_adds_lock = threading.Lock()
+
+        def sync_file(file):
+            try:
+                status, asset_id = self._sync_file(file, album_id, catalogue_id, album_state, album_asset_ids)
+                if asset_id:
+                    batch = None
+                    with pending_adds_lock:
+                        pending_adds.append((file, asset_id))
+                        if len(pending_adds) >= ALBUM_ADD_BATCH_SIZE:
+                            batch = pending_adds[:]
+                            pending_adds.clear()
+                    # The worker that fills a batch sends it; the others keep transferring
+                    if batch:
+                        self._add_assets_to_album(catalogue_id, album_id, batch, album_state)
+                return status
+            finally:
+                progress.advance(task)
+        
+        # Each file is network-bound (Drive download + 2 Lightroom PUTs), so run
+        # several pipelines side by side instead of one after another. Files are
+        # submitted as the listing yields them, overlapping paging with transfers.
+        with progress, ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            try:
+                results = list(executor.map(sync_file, listed_files()))
+                if pending_adds:
+                    self._add_assets_to_album(catalogue_id, album_id, pending_adds, album_state)
+            finally:
+                self._save_sync_state()
+        
+        if not results:
+            console.print("\n⏩ [bold yellow]No files to synchronize.[/bold yellow]")
+            return
+        
+        uploaded = results.count('uploaded')
+        unchanged = results.count('unchanged')
+        console.print(f"\n✅ [bold green]Synchronization process complete![/bold green] ({uploaded}/{len(results)} files uploaded, {unchanged} unchanged)")
+
+    def _sync_file(self, file, album_id, catalogue_id, album_state, album_asset_ids):
+        """
+        Download a single Drive file and upload it to the Lightroom album, unless the
+        same content was uploaded by an earlier run and is still in the album.
+        Returns ('uploaded', asset ID), ('unchanged', None) or ('failed', None); the
+        caller adds uploaded assets to the album.
+        """
+        file_name = file.get('name', 'Unknown File')
+        file_id = file.get('id')
+        # Prefer the extension's type: Drive reports some image formats as octet-stream
+        file_mime_type = self._guess_mime(file_name) or file.get('mimeType', 'application/octet-stream')
+        file_size = int(file['size']) if file.get('size') else None
+
+        if not file_id:
+            console.print(f"        ⚠️ Skipping '{file_name}' - no file ID found.", style="yellow", markup=False, highlight=False)
+            return 'failed', None
+
+        md5 = file.get('md5Checksum')
+        previous = album_state.get(file_id)
+        if md5 and previous and previous.get('md5') == md5 and previous.get('asset_id') in album_asset_ids:
+            self._log(f"    ⏩ '{file_name}' is unchanged and already in the album, skipping.")
+            return 'unchanged', None
+
+        with span(self._tracer, "sync.file", file_id=file_id, size=file_size or 0):
+            with span(self._tracer, "drive.download", file_id=file_id):
+                file_content = self._download_file_from_drive(file_id, file_name, file_size)
+            if not file_content:
+                console.print(f"        ❌ Failed to get content for '{file_name}', skipping upload.", style="red", markup=False, highlight=False)
+                return 'failed', None
+
+            try:
+                asset_id = self._upload_file_to_lightroom(catalogue_id, file_content, file_name, album_id, file_mime_type)
+            finally:
+                if isinstance(file_content, (DriveFileStream, RangedDriveFileStream)):
+                    file_content.close()
         
-        console.print("\n✅ [bold green]Synchronization process complete![/bold green]")
\ No newline at end of file
+        if not asset_id:
+            return 'failed', None
+        return 'uploaded', asset_id
\ No newline at end of file
@@ -0,0 +1,54 @@
+"""
+Optional OpenTelemetry tracing of the sync stages.
+Spans are only recorded when SYNC_OTLP_ENDPOINT is set (and the OpenTelemetry
+packages are installed); otherwise span() hands back a no-op context manager.
+"""
+
+import os
+from contextlib import nullcontext
+from rich.console import Console
+
+console = Console()
+
+_tracer = None
+_tracer_initialized = False
+
+def get_tracer():
+    """
+    Returns the sync tracer, or None when tracing is off.
+    The OTLP exporter is set up on the first call; spans are exported in batches
+    in the background and flushed when the process exits.
+    """
+    global _tracer, _tracer_initialized
+    if _tracer_initialized:
+        return _tracer
+    _tracer_initialized = True
+
+    endpoint = os.getenv('SYNC_OTLP_ENDPOINT')
+    if not endpoint:
+        return None
+
+    try:
+        from opentelemetry import trace
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+    except ImportError:
+        console.print("⚠️ [yellow]SYNC_OTLP_ENDPOINT is set but OpenTelemetry is not installed, tracing is off[/yellow]")
+        return None
+
+    provider = TracerProvider(resource=Resource.create({'service.name': 'drive-to-lightroomcc'}))
+    provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter(endpoint=endpoint)))
+    trace.set_tracer_provider(provider)
+    _tracer = trace.get_tracer('drive-to-lightroomcc')
+    console.print(f"📈 [dim]Exporting sync traces to {endpoint}[/dim]")
+    return _tracer
+
+def span(tracer, name, **attributes):
+    """
+    Context manager timing one sync stage as a span named `name`
+    """
+    if tracer is None:
+        return nullcontext()
+    return tracer.start_as_current_span(name, attributes=attributes)
@@ -5,63 +5,282 @@ Handles folder and album selection with rich UI (Python 3.13 compatible)
 """
 
 import json
-import requests
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.prompt import Prompt
+from auth.adobe_auth import ADOBE_JSON_PREFIX, ADOBE_JSON_PREFIX_LEN
 
 
 console = Console()
 
+def _new_spinner_progress():
+    """
+    Build the spinner display a selector shows while it waits on the network
+    """
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+    )
+
+@contextmanager
+def _spinner(progress, description):
+    """
+    Show a spinner with the given description on `progress` while the block runs
+    """
+    task = progress.add_task(description, total=None)
+    progress.start()
+    try:
+        yield
+    finally:
+        progress.remove_task(task)
+        progress.stop()
+
+def _discard(*args, **kwargs):
+    """
+    Stand-in for console.print when output is suppressed
+    """
+
+FOLDER_QUERY_SUFFIX = "mimeType='application/vnd.google-apps.folder' and trashed=false"
+
+# How many folder screens (rendered options + choices) the folder selector keeps
+FOLDER_VIEW_CACHE_SIZE = 32
+
+# Drive accepts a few dozen "in parents" clauses per query; stay well inside that
+MAX_PARENTS_PER_QUERY = 20
+
 class GoogleDriveFolderSelector:
     def __init__(self, google_auth):
         self.google_auth = google_auth
         self.service = google_auth.get_service()
+        # Folder id -> display path, and -> {'name', 'parents'} metadata. Listings
+        # fill the metadata, so paths and parents of listed folders need no extra calls.
+        self._path_cache = {'root': "📁 My Drive"}
+        self._folder_cache = {}
+        # Subfolder listings fetched ahead of time by list_folders_multi; each is used once
+        self._prefetched_listings = {}
+        # Folder id -> (rendered options block, options, prompt choices), least recently
+        # shown first, so revisiting a folder needs neither a listing nor a re-render
+        self._folder_views = OrderedDict()
+        # Runs the path lookup, the folder listing of the next location and
+        # sibling prefetches side by side
+        self._executor = ThreadPoolExecutor(max_workers=3)
+        self._thread_local = threading.local()
+        # Spinner display reused by every folder fetch
+        self._progress = _new_spinner_progress()
+    
+    def _execute(self, request):
+        """
+        Execute a Drive API request on the calling thread's own HTTP transport
+        """
+        http = getattr(self._thread_local, 'http', None)
+        if http is None:
+            http = self._thread_local.http = self.google_auth.new_http()
+        return request.execute(http=http)
     
-    def list_folders(self, parent_id='root', max_results=50):
+    def list_folders(self, parent_id='root', max_results=1000):
         """
         List folders in Google Drive
         """
+        prefetched = self._prefetched_listings.pop(parent_id, None)
+        if prefetched is not None:
+            return prefetched
+        
         try:
-            # Query for folders only
-            query = f"'{parent_id}' in parents and mimeType='application/vnd.google-apps.folder' and trashed=false"
-            
-            results = self.service.files().list(
-                q=query,
-                pageSize=max_results,
-                fields="files(id, name, parents, modifiedTime)"
-            ).execute()
-            
-            folders = results.get('files', [])
-            return folders
-            
+            return self._query_folders(parent_id, max_results)
         except Exception as e:
             console.print(f"❌ Error listing folders: {e}", style="red")
             return []
     
+    def _query_folders(self, parent_id, max_results=1000):
+        """
+        Fetch the subfolders of one folder from Drive; errors are raised to the caller
+        """
+        # Query for folders only
+        query = f"'{parent_id}' in parents and {FOLDER_QUERY_SUFFIX}"
+        
+        results = self._execute(self.service.files().list(
+            q=query,
+            pageSize=max_results,
+            fields="files(id,name,parents)"
+        ))
+        
+        folders = results.get('files', [])
+        for folder in folders:
+            self._folder_cache[folder['id']] = folder
+        # Top-level folders name My Drive by its real id, not the 'root' alias.
+        # Give that id the root path so path walks stop there instead of
+        # fetching My Drive itself (which showed up as "My Drive / My Drive").
+        if parent_id == 'root' and folders and folders[0].get('parents'):
+            self._path_cache[folders[0]['parents'][0]] = self._path_cache['root']
+        return folders
+    
+    def list_folders_multi(self, parent_ids):
+        """
+        List the subfolders of several folders at once, with one query per
+        MAX_PARENTS_PER_QUERY parents instead of one per folder.
+        Returns {parent_id: [folders]}, without the folders that could not be listed
+        """
+        listings = {}
+        for start in range(0, len(parent_ids), MAX_PARENTS_PER_QUERY):
+            chunk = parent_ids[start:start + MAX_PARENTS_PER_QUERY]
+            try:
+                listings.update(self._query_folders_multi(chunk))
+            except Exception:
+                # Drive rejects queries it finds too complex with a 400; list this
+                # chunk one folder at a time instead, leaving out any that still fail
+                for parent_id in chunk:
+                    try:
+                        listings[parent_id] = self._query_folders(parent_id)
+                    except Exception:
+                        pass
+        return listings
+    
+    def _query_folders_multi(self, parent_ids):
+        """
+        Fetch the subfolders of several folders with a single (paged) query.
+        Returns {parent_id: [folders]}; errors are raised to the caller.
+        """
+        listings = {parent_id: [] for parent_id in parent_ids}
+        parents_clause = " or ".join(f"'{parent_id}' in parents" for parent_id in parent_ids)
+        query = f"({parents_clause}) and {FOLDER_QUERY_SUFFIX}"
+        
+        page_token = None
+        while True:
+            results = self._execute(self.service.files().list(
+                q=query,
+                pageSize=1000,
+                pageToken=page_token,
+                fields="nextPageToken,files(id,name,parents)"
+            ))
+            for folder in results.get('files', []):
+                self._folder_cache[folder['id']] = folder
+                for parent_id in folder.get('parents', []):
+                    if parent_id in listings:
+                        listings[parent_id].append(folder)
+            page_token = results.get('nextPageToken')
+            if not page_token:
+                break
+        return listings
+    
+    def _prefetch_listings(self, parent_ids):
+        """
+        Background task: fetch the subfolders of the given folders so opening any of
+        them doesn't wait on the network. Folders that fail to list are just not prefetched.
+        """
+        try:
+            listings = self.list_folders_multi(parent_ids)
+        except Exception:
+            return
+        self._prefetched_listings.clear()
+        self._prefetched_listings.update(listings)
+    
+    def _get_folder(self, folder_id):
+        """
+        Get a folder's name and parents, from the cache when it has been seen before
+        """
+        folder = self._folder_cache.get(folder_id)
+        if folder is None:
+            folder = self._execute(self.service.files().get(fileId=folder_id, fields="name, parents"))
+            self._folder_cache[folder_id] = folder
+        return folder
+    
     def get_folder_path(self, folder_id):
         """
         Get the full path of a folder
         """
+        cached_path = self._path_cache.get(folder_id)
+        if cached_path:
+            return cached_path
+        
+        # Walk up until an ancestor with a known path (or the top of the drive),
+        # fetching only folders that no listing or earlier walk has seen
+        chain = []
+        current_id = folder_id
         try:
-            if folder_id == 'root':
-                return "📁 My Drive"
-            
-            # Get folder info
-            folder = self.service.files().get(fileId=folder_id, fields="name, parents").execute()
-            folder_name = folder.get('name', 'Unknown')
-            
-            # Get parent path recursively
-            parents = folder.get('parents', [])
-            if parents and parents[0] != 'root':
-                parent_path = self.get_folder_path(parents[0])
-                return f"{parent_path} / {folder_name}"
-            else:
-                return f"📁 My Drive / {folder_name}"
-                
+            while True:
+                folder = self._get_folder(current_id)
+                chain.append((current_id, folder.get('name', 'Unknown')))
+                parents = folder.get('parents', [])
+                if not parents or parents[0] == 'root':
+                    path = "📁 My Drive"
+                    break
+                current_id = parents[0]
+                if current_id in self._path_cache:
+                    path = self._path_cache[current_id]
+                    break
         except Exception as e:
             return f"📁 Unknown Path ({folder_id})"
+        
+        # Build the path back down, remembering it for every folder on the way
+        for chain_id, name in reversed(chain):
+            path = f"{path} / {name}"
+            self._path_cache[chain_id] = path
+        return path
+    
+    def _open_folder(self, folder_id):
+        """
+        Resolve a folder's path while its listing loads in the background.
+        Returns (path, future of the folder's subfolders, or None if its screen is cached).
+        """
+        listing = None
+        if folder_id not in self._folder_views:
+            listing = self._executor.submit(self.list_folders, folder_id)
+        return self.get_folder_path(folder_id), listing
+    
+    def _build_folder_view(self, folder_id, pending_listing=None, prefetch_subfolders=False):
+        """
+        List a folder and render its options screen.
+        Returns (rendered options block, options, prompt choices), or None when
+        My Drive itself has no folders.
+        """
+        # Load folders with progress indicator
+        with _spinner(self._progress, "Loading folders..."):
+            if pending_listing:
+                folders = pending_listing.result()
+            else:
+                folders = self.list_folders(folder_id)
+        
+        if prefetch_subfolders and folders:
+            self._executor.submit(self._prefetch_listings, [folder['id'] for folder in folders])
+        
+        # Prepare options
+        options = []
+        
+        # Add option to select current folder (if not root)
+        if folder_id != 'root':
+            options.append(("select", "✅ Select this folder", None))
+        
+        # Add option to go back (if not root)
+        if folder_id != 'root':
+            options.append(("back", "⬅️  Go back to parent folder", None))
+        
+        # Add folders
+        for folder in folders:
+            folder_name = folder.get('name', 'Unknown')
+            options.append(("folder", f"📁 {folder_name}", folder))
+        
+        if not options:
+            return None
+        
+        # Display options: render the whole block once so it can be written in one
+        # go (and again from the cache), rather than one console.print per folder
+        options_text = "\n".join(f"  {i}. {description}" for i, (_, description, _) in enumerate(options, 1))
+        with console.capture() as capture:
+            if not folders:
+                console.print("📂 No folders found")
+                console.print("You can select this folder or go back")
+            console.print("\n[bold]Options:[/bold]")
+            # Folder names are shown verbatim, not parsed as markup
+            console.print(options_text, markup=False)
+        
+        choices = [str(i) for i in range(1, len(options) + 1)]
+        return capture.get(), options, choices
     
     def select_folder(self):
         """
@@ -72,63 +291,34 @@ class GoogleDriveFolderSelector:
         
         current_folder_id = 'root'
         current_path = "📁 My Drive"
+        # Listing of the next location, started while its path was being resolved
+        pending_listing = None
+        # After going back, the user usually opens a sibling of the folder they left
+        prefetch_subfolders = False
         
         while True:
             console.print(f"\n📍 Current location: [bold]{current_path}[/bold]")
             
-            # Load folders with progress indicator
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-            ) as progress:
-                task = progress.add_task("Loading folders...", total=None)
-                folders = self.list_folders(current_folder_id)
-                progress.remove_task(task)
-            
-            # Prepare options
-            options = []
-            
-            # Add option to select current folder (if not root)
-            if current_folder_id != 'root':
-                options.append(("select", "✅ Select this folder", None))
-            
-            # Add option to go back (if not root)
-            if current_folder_id != 'root':
-                options.append(("back", "⬅️  Go back to parent folder", None))
-            
-            # Add folders
-            for i, folder in enumerate(folders):
-                folder_name = folder.get('name', 'Unknown')
-                options.append(("folder", f"📁 {folder_name}", folder))
-            
-            if not options:
-                console.print("📂 No folders found")
-                if current_folder_id == 'root':
+            view = self._folder_views.get(current_folder_id)
+            if view:
+                self._folder_views.move_to_end(current_folder_id)
+            else:
+                view = self._build_folder_view(current_folder_id, pending_listing, prefetch_subfolders)
+                if view is None:
+                    console.print("📂 No folders found")
                     console.print("❌ No folders found in your Google Drive")
                     return None, None
-                else:
-                    console.print("You can select this folder or go back")
-                    options.append(("select", "✅ Select this folder", None))
-                    options.append(("back", "⬅️  Go back to parent folder", None))
+                self._folder_views[current_folder_id] = view
+                if len(self._folder_views) > FOLDER_VIEW_CACHE_SIZE:
+                    self._folder_views.popitem(last=False)
+            pending_listing = None
+            prefetch_subfolders = False
             
-            # Display options
-            console.print("\n[bold]Options:[/bold]")
-            for i, (action, description, data) in enumerate(options, 1):
-                console.print(f"  {i}. {description}")
+            rendered_options, options, choices = view
+            console.file.write(rendered_options)
             
-            # Get user choice
-            while True:
-                try:
-                    choice = Prompt.ask(
-                        "\n[bold]Choose an option[/bold]",
-                        choices=[str(i) for i in range(1, len(options) + 1)],
-                        default="1"
-                    )
-                    choice_idx = int(choice) - 1
-                    break
-                except (ValueError, IndexError):
-                    console.print("❌ Invalid choice, please try again", style="red")
+            # Get user choice; Prompt.ask re-prompts until the answer is one of the choices
+            choice_idx = int(Prompt.ask("\n[bold]Choose an option[/bold]", choices=choices, default="1")) - 1
             
             action, description, data = options[choice_idx]
             
@@ -141,11 +331,12 @@ class GoogleDriveFolderSelector:
                 # Go back to parent
                 if current_folder_id != 'root':
                     try:
-                        folder = self.service.files().get(fileId=current_folder_id, fields="parents").execute()
+                        folder = self._get_folder(current_folder_id)
                         parents = folder.get('parents', [])
                         if parents:
                             current_folder_id = parents[0]
-                            current_path = self.get_folder_path(current_folder_id)
+                            current_path, pending_listing = self._open_folder(current_folder_id)
+                            prefetch_subfolders = True
                         else:
                             current_folder_id = 'root'
                             current_path = "📁 My Drive"
@@ -156,42 +347,64 @@ class GoogleDriveFolderSelector:
             elif action == "folder":
                 # User selected a subfolder
                 current_folder_id = data['id']
-                current_path = self.get_folder_path(current_folder_id)
+                current_path, pending_listing = self._open_folder(current_folder_id)
 
 class LightroomAlbumSelector:
     def __init__(self, adobe_auth):
         self.adobe_auth = adobe_auth
         self.api_base = "https://lr.adobe.io"
-        self.headers = self.adobe_auth.get_headers() 
+        # The auth's pooled keep-alive session (with retries and ETag revalidation)
+        self.session = adobe_auth.session
         self.catalog_id = None
+        # Catalog-relative base for next-page links, and the albums URL; set with catalog_id
+        self._catalog_url = None
+        self._albums_url = None
         self.display_page_size = 25 # How many albums to display per screen
+        self.api_page_size = 100 # How many albums to fetch per API call
+        # Fetches the next page in the background while the user looks at the current one
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        # Spinner display reused by every album fetch
+        self._progress = _new_spinner_progress()
 
-    def _parse_adobe_response(self, response_text):
+    def _parse_adobe_response(self, response_content):
         """
-        Parse Adobe's response, removing the security prefix
+        Parse Adobe's response, removing the security prefix.
+        Takes the raw body bytes: json.loads reads UTF-8 bytes directly, so the
+        body never goes through requests' text decoding.
         """
-        if response_text.startswith('while (1) {}'):
-            return json.loads(response_text[12:])
-        return json.loads(response_text)
+        if response_content.startswith(ADOBE_JSON_PREFIX):
+            return json.loads(response_content[ADOBE_JSON_PREFIX_LEN:])
+        return json.loads(response_content)
+    
+    def _get(self, url, params=None):
+        """
+        GET from the Lightroom API with the current token. The token is only
+        refreshed if the API rejects it (401), and the request is then sent once more.
+        """
+        headers = self.adobe_auth.get_headers()
+        response = self.session.get(url, headers=headers, params=params, timeout=self.adobe_auth.timeout)
+        if response.status_code == 401 and self.adobe_auth.refresh_rejected_token(headers):
+            response = self.session.get(url, headers=self.adobe_auth.get_headers(), params=params, timeout=self.adobe_auth.timeout)
+        return response
     
     def get_catalog_id(self):
         """
         Step 1: Get the user's catalog ID (required for all other calls)
         """
-        # Ensure headers are up-to-date here too in case of stale token
-        self.headers = self.adobe_auth.get_headers() 
         console.print("🔍 Getting user catalog...")
         
         try:
-            response = requests.get(f"{self.api_base}/v2/catalog", headers=self.headers)
+            response = self._get(f"{self.api_base}/v2/catalog")
             
             console.print(f"   Status: {response.status_code}")
             
             if response.status_code == 200:
-                data = self._parse_adobe_response(response.text)
+                data = self._parse_adobe_response(response.content)
                 
                 if 'id' in data:
                     self.catalog_id = data['id']
+                    self._catalog_url = f"{self.api_base}/v2/catalogs/{self.catalog_id}/"
+                    self._albums_url = f"{self._catalog_url}albums"
                     console.print(f"   ✅ Catalog ID: {self.catalog_id}")
                     return True
                 else:
@@ -205,111 +418,99 @@ class LightroomAlbumSelector:
                 console.print("   🚫 Access denied - check your API permissions")
                 return False
             else:
-                console.print(f"   ❌ Error {response.status_code}: {response.text}")
+                console.print(f"   ❌ Error {response.status_code}: {response.content.decode('utf-8', 'replace')}")
                 return False
                 
         except Exception as e:
             console.print(f"   💥 Exception: {e}")
             return False
     
-    def list_albums(self, limit=None, offset=0, next_link=None):
+    def list_albums(self, limit=None, offset=0, next_link=None, quiet=False):
         """
         Step 2: List albums using the catalog ID with pagination
         Returns (albums_list_for_current_fetch, next_page_link_or_None)
         
         If next_link is provided, it takes precedence over limit and offset.
+        quiet suppresses all output, for background prefetches.
         """
+        log = _discard if quiet else console.print
+        
         if not self.catalog_id:
-            console.print("❌ No catalog ID - call get_catalog_id() first")
+            log("❌ No catalog ID - call get_catalog_id() first")
             return [], None 
         
         try:
-            url = next_link if next_link else f"{self.api_base}/v2/catalogs/{self.catalog_id}/albums"
+            url = next_link or self._albums_url
             
-            params = {}
             # Only apply limit and offset if a direct next_link is NOT being used
+            params = {}
             if not next_link: 
                 if limit is not None:
                     params['limit'] = limit
                 if offset > 0:
                     params['offset'] = offset
             
-            console.print(f"🎨 Fetching albums from: {url} with params: {params}")
+            log(f"🎨 Fetching albums from: {url} with params: {params}")
             
-            response = requests.get(url, headers=self.headers, params=params)
-            console.print(f"   Status: {response.status_code}")
+            response = self._get(url, params=params)
+            log(f"   Status: {response.status_code}")
             
             albums = []
             next_page_link = None 
 
             if response.status_code == 200:
-                data = self._parse_adobe_response(response.text)
+                data = self._parse_adobe_response(response.content)
                 
                 # Check for pagination link
                 if 'links' in data and 'next' in data['links']:
                     next_link_href = data['links']['next']['href']
                     if next_link_href: # Ensure href exists
-                        next_page_link = f"{self.api_base}/v2/catalogs/{self.catalog_id}/{next_link_href}"
-                    console.print(f"   ➡️ Next page link in response: {next_page_link}")
+                        next_page_link = f"{self._catalog_url}{next_link_href}"
+                    log(f"   ➡️ Next page link in response: {next_page_link}")
                 
-                if 'resources' in data and isinstance(data['resources'], list):
-                    console.print(f"   🎯 Found {len(data['resources'])} albums in 'resources' for current fetch")
-                    for album_data in data['resources']:
-                        album = self._extract_album_info(album_data)
-                        if album['id']:
-                            albums.append(album)
+                resources = data.get('resources')
+                if isinstance(resources, list):
+                    log(f"   🎯 Found {len(resources)} albums in 'resources' for current fetch")
+                    # Keep only the few fields the menu shows, not the full album records
+                    albums = [album for album in map(self._extract_album_info, resources) if album['id']]
                 else:
-                    console.print(f"   ⚠️  Unexpected response structure for albums: {json.dumps(data, indent=2)[:500]}...")
+                    # Name the top-level keys rather than pretty-printing the whole response
+                    log(f"   ⚠️  Unexpected response structure for albums, keys: {list(data.keys())}")
                 
                 return albums, next_page_link
                 
             elif response.status_code == 404:
-                console.print("   📭 Catalog not found - catalog_id might be invalid")
+                log("   📭 Catalog not found - catalog_id might be invalid")
                 return [], None
             elif response.status_code == 401:
-                console.print("   🔐 Authentication failed")
+                log("   🔐 Authentication failed")
                 return [], None
             elif response.status_code == 403:
-                console.print("   🚫 Access denied")
+                log("   🚫 Access denied")
                 return [], None
             else:
-                console.print(f"   ❌ Error {response.status_code}: {response.text[:200]}")
+                log(f"   ❌ Error {response.status_code}: {response.content[:200].decode('utf-8', 'replace')}")
                 return [], None
                 
         except Exception as e:
-            console.print(f"   💥 Exception: {e}")
+            log(f"   💥 Exception: {e}")
             return [], None
     
     def _extract_album_info(self, album_data):
         """
         Extract album information from the API response
         """
-        album_info = {
-            'id': None,
-            'name': 'Unnamed Album',
-            'created': None,
-            'updated': None,
-            'subtype': None
-        }
+        payload = album_data.get('payload')
+        if not isinstance(payload, dict):
+            payload = {}
         
-        if 'id' in album_data:
-            album_info['id'] = album_data['id']
-        
-        if 'payload' in album_data and isinstance(album_data['payload'], dict):
-            payload = album_data['payload']
-            
-            if 'name' in payload:
-                album_info['name'] = payload['name']
-            
-            if 'subtype' in payload:
-                album_info['subtype'] = payload['subtype']
-        
-        if 'created' in album_data:
-            album_info['created'] = album_data['created']
-        if 'updated' in album_data:
-            album_info['updated'] = album_data['updated']
-        
-        return album_info
+        return {
+            'id': album_data.get('id'),
+            'name': payload.get('name', 'Unnamed Album'),
+            'created': album_data.get('created'),
+            'updated': album_data.get('updated'),
+            'subtype': payload.get('subtype')
+        }
     
     def select_album(self):
         """
@@ -320,62 +521,56 @@ class LightroomAlbumSelector:
         console.print("=" * 60)
         
         # Step 1: Get catalog ID
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Getting catalog information...", total=None)
-            
+        with _spinner(self._progress, "Getting catalog information..."):
             if not self.get_catalog_id():
-                progress.remove_task(task)
                 console.print("❌ Failed to get catalog ID")
                 return None, None
-            
-            progress.remove_task(task) 
 
-        # This list will hold only the albums for the currently displayed page
-        current_page_albums = [] 
+        # Every album fetched so far; pages are shown as slices of this buffer, so
+        # the API is asked for api_page_size albums at a time, not one screenful
+        buffered_albums = []
         # This variable will hold the 'next' URL provided by the Adobe API for the next fetch
         next_api_url = None 
-        # This stack will store (offset, next_url) tuples for previously viewed pages to go back
-        previous_page_states = [] 
-        # This tracks the current API offset for the page being viewed
-        current_api_offset = 0 
+        # Offset into buffered_albums of the page being viewed
+        display_offset = 0 
 
         # --- Initial Load of the first page of albums from API ---
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Loading initial albums...", total=None)
-            
-            # Fetch the first batch of albums using offset 0 and the display_page_size
+        with _spinner(self._progress, "Loading initial albums..."):
             fetched_albums, fetched_next_link = self.list_albums(
-                limit=self.display_page_size, # Request exactly the display page size
-                offset=current_api_offset 
+                limit=self.api_page_size,
+                offset=0
             )
             
             if not fetched_albums:
-                progress.remove_task(task)
                 console.print("📱 No albums found in your Lightroom CC catalog")
                 console.print("💡 Make sure you have albums created in Lightroom CC")
                 return None, None
 
-            current_page_albums = fetched_albums
+            buffered_albums.extend(fetched_albums)
             next_api_url = fetched_next_link
-            progress.remove_task(task)
+
+        # (next_api_url, future) of the next API page, fetched while the user reads
+        next_page_prefetch = None
 
         # --- Interactive Display and Selection Loop ---
         while True:
+            current_page_albums = buffered_albums[display_offset:display_offset + self.display_page_size]
+            
+            # Start fetching the next API page once the user is looking at the last buffered screenful
+            near_end = display_offset + 2 * self.display_page_size > len(buffered_albums)
+            if near_end and next_api_url and (not next_page_prefetch or next_page_prefetch[0] != next_api_url):
+                next_page_prefetch = (
+                    next_api_url,
+                    self._executor.submit(self.list_albums, next_link=next_api_url, quiet=True)
+                )
+
             num_albums_on_current_page = len(current_page_albums)
             
             # Display the albums in a Rich Table
             # The title now reflects the current offset and count on the page
             table = Table(
                 title=f"Albums in Catalog: {self.catalog_id} "
-                      f"(Displaying {current_api_offset + 1}-{current_api_offset + num_albums_on_current_page})"
+                      f"(Displaying {display_offset + 1}-{display_offset + num_albums_on_current_page})"
             )
             table.add_column("#", style="bold", width=4)
             table.add_column("Album Name", style="cyan")
@@ -386,23 +581,30 @@ class LightroomAlbumSelector:
             for i, album in enumerate(current_page_albums):
                 # Numbering from 1 for the current page
                 display_index = i + 1 
-                created = album.get('created', 'Unknown')[:10] if album.get('created') else 'Unknown'
-                updated = album.get('updated', 'Unknown')[:10] if album.get('updated') else 'Unknown'
-                subtype = album.get('subtype', 'album')
+                created = album.get('created')
+                updated = album.get('updated')
                 
-                table.add_row(str(display_index), album['name'], subtype, created, updated)
+                table.add_row(
+                    str(display_index),
+                    album['name'],
+                    album.get('subtype', 'album'),
+                    created[:10] if created else 'Unknown',
+                    updated[:10] if updated else 'Unknown'
+                )
             
             console.print(table)
             
-            # Prepare valid choices for the user prompt
-            valid_choices = []
+            # 'p' (previous) is an option if this isn't the first page
+            has_previous = display_offset > 0
+            # 'n' (next) is an option if more albums are buffered or the API has more
+            has_next = bool(display_offset + self.display_page_size < len(buffered_albums) or next_api_url)
             
-            # 'p' (previous) is an option if there are previous page states in the stack
-            if previous_page_states:
+            # Prepare valid choices for the user prompt (kept as an ordered list for display);
+            # the prompt text below checks the flags rather than scanning this list
+            valid_choices = []
+            if has_previous:
                 valid_choices.append("p")
-            
-            # 'n' (next) is an option if there's a next API URL
-            if next_api_url:
+            if has_next:
                 valid_choices.append("n")
             
             # Allow selecting any album by its number on the current page
@@ -410,58 +612,39 @@ class LightroomAlbumSelector:
 
             # Construct the prompt message dynamically
             prompt_message = "\n[bold]Select an album (enter #)"
-            if "p" in valid_choices: prompt_message += " or (p)revious"
-            if "n" in valid_choices: prompt_message += " or (n)ext"
+            if has_previous: prompt_message += " or (p)revious"
+            if has_next: prompt_message += " or (n)ext"
             prompt_message += "[/bold]"
             
             user_input = Prompt.ask(prompt_message, choices=valid_choices).lower()
             
             if user_input == 'p':
-                if previous_page_states:
-                    # Pop the last state from the stack to go back
-                    prev_offset, prev_next_url = previous_page_states.pop()
-                    current_api_offset = prev_offset
-                    next_api_url = prev_next_url # Restore the next URL for this previous page
-                    
-                    with Progress(
-                        SpinnerColumn(),
-                        TextColumn("[progress.description]{task.description}"),
-                        console=console,
-                    ) as progress:
-                        task = progress.add_task(f"Loading previous albums...", total=None)
-                        # Fetch the previous page using the saved offset
-                        fetched_albums, _ = self.list_albums( # We don't need the next link from this call, as we already have it
-                            limit=self.display_page_size, 
-                            offset=current_api_offset
-                        )
-                        current_page_albums = fetched_albums
-                        progress.remove_task(task)
+                if display_offset > 0:
+                    # Previous pages are always still in the buffer
+                    display_offset -= self.display_page_size
                 else:
                     console.print("   No previous page.", style="yellow")
             elif user_input == 'n':
-                if next_api_url:
-                    # Save the current page's state (offset and its next_api_url) before moving to the next page
-                    previous_page_states.append((current_api_offset, next_api_url))
-                    
-                    # Update current_api_offset for the next page (even if using next_link, for tracking)
-                    current_api_offset += self.display_page_size 
-
-                    with Progress(
-                        SpinnerColumn(),
-                        TextColumn("[progress.description]{task.description}"),
-                        console=console,
-                    ) as progress:
-                        task = progress.add_task(f"Loading next albums...", total=None)
+                next_offset = display_offset + self.display_page_size
+                # Only go to the API when the next page isn't fully buffered yet
+                if next_offset + self.display_page_size > len(buffered_albums) and next_api_url:
+                    with _spinner(self._progress, "Loading next albums..."):
+                        # Use the page prefetched in the background; fetch it again (with
+                        # output) only if the prefetch came back empty, e.g. on an error
+                        fetched_albums, fetched_next_link = [], None
+                        if next_page_prefetch and next_page_prefetch[0] == next_api_url:
+                            fetched_albums, fetched_next_link = next_page_prefetch[1].result()
+                        if not fetched_albums:
+                            # Call list_albums using the stored next_api_url
+                            fetched_albums, fetched_next_link = self.list_albums(
+                                next_link=next_api_url # Use the direct next link for the API call
+                            )
                         
-                        # Call list_albums using the stored next_api_url
-                        fetched_albums, fetched_next_link = self.list_albums(
-                            next_link=next_api_url # Use the direct next link for the API call
-                        )
-                        
-                        current_page_albums = fetched_albums
+                        buffered_albums.extend(fetched_albums)
                         next_api_url = fetched_next_link # Update next_api_url for the newly fetched page
-                        
-                        progress.remove_task(task)
+                
+                if next_offset < len(buffered_albums):
+                    display_offset = next_offset
                 else:
                     console.print("   No more albums to display or fetch.", style="yellow")
             else: